@@ -1,16 +1,232 @@
 import argparse
+import asyncio
 import csv
+import gzip
 import json
+import logging
+import multiprocessing
+import os
+import re
+import sys
+import threading
 import time
 import urllib.error
 import urllib.request
+import zlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
+from email.utils import parsedate_to_datetime
 from pathlib import Path
 from typing import Any, Optional
 
+# Optional dependencies, imported on first use by load_json_backend and
+# load_http_backend so --help and the pure extraction code don't pay for them
+msgspec = None
+urllib3 = None
+aiohttp = None
+_loads = json.loads
+
+logger = logging.getLogger(__name__)
+
 API_HOST = "https://explorer.natureserve.org"
 API_PATH = "/api/data/taxon/"
 
+MAX_WORKERS = 8
+ASYNC_CONCURRENCY = 16
+REQUESTS_PER_SECOND = 4
+MIN_REQUESTS_PER_SECOND = 0.25
+MAX_REQUESTS_PER_SECOND = 8
+RATE_INCREASE = 0.1
+RATE_LIMIT_RETRIES = 3
+FLUSH_EVERY = 32
+BACKENDS = ("stdlib", "urllib3", "aiohttp")
+
+# Responses at least this big are parsed in a separate process so the parse
+# doesn't hold the GIL while other fetches are in flight; below it the IPC
+# costs more than it saves
+PARSE_IN_PROCESS_BYTES = 32 * 1024
+PARSE_WORKERS = min(4, os.cpu_count() or 1)
+
+# Directory for cached raw API responses; None disables the cache (see --cache)
+CACHE_DIR: Optional[Path] = None
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Convert a Retry-After header (seconds or HTTP date) to seconds from now."""
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+        return max(0.0, retry_at.timestamp() - time.time())
+    except Exception:
+        return None
+
+
+class RateLimiter:
+    """
+    Pace requests across all workers, adapting to the server (AIMD).
+
+    Every non-429 response raises the rate by RATE_INCREASE up to max_rate.
+    A 429 halves it (down to min_rate), at most once per round of already
+    handed-out slots so a burst of 429s from requests already in flight only
+    counts once. When the server sends Retry-After, no caller sends again
+    until that time has passed, including callers that were already waiting
+    on an earlier slot.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        min_rate: float = MIN_REQUESTS_PER_SECOND,
+        max_rate: float = MAX_REQUESTS_PER_SECOND,
+    ):
+        self.rate = rate
+        self._min_rate = min_rate
+        self._max_rate = max(rate, max_rate)
+        self._next_slot = time.monotonic()
+        self._hold_until = 0.0
+        self._decrease_after = 0.0
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Claim the next request slot, returning seconds until it opens."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + 1.0 / self.rate
+        return slot - now
+
+    def _held(self) -> bool:
+        """Whether a Retry-After hold-off is still in effect."""
+        with self._lock:
+            return time.monotonic() < self._hold_until
+
+    def acquire(self):
+        """Block until the next request slot is available."""
+        while True:
+            delay = self._reserve()
+            if delay > 0:
+                time.sleep(delay)
+            # A 429 may have started a hold-off while we slept; if so, take a
+            # fresh slot, which on_response has pushed past the hold-off
+            if not self._held():
+                return
+
+    async def acquire_async(self):
+        """Wait on the event loop until the next request slot is available."""
+        while True:
+            delay = self._reserve()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if not self._held():
+                return
+
+    def on_response(self, status: int, headers=None):
+        """Adjust the rate after a response."""
+        with self._lock:
+            if status != 429:
+                self.rate = min(self._max_rate, self.rate + RATE_INCREASE)
+                return
+
+            now = time.monotonic()
+            retry_after = parse_retry_after(
+                headers.get("Retry-After") if headers else None
+            )
+            if retry_after:
+                self._hold_until = max(self._hold_until, now + retry_after)
+                self._next_slot = max(self._next_slot, self._hold_until)
+
+            # 429s for requests sent before the last slowdown took effect
+            # don't slow us down again
+            if now >= self._decrease_after:
+                self.rate = max(self._min_rate, self.rate / 2)
+                self._decrease_after = max(self._next_slot, self._hold_until)
+
+
+RATE_LIMITER = RateLimiter(REQUESTS_PER_SECOND)
+
+# (API list key, nested habitat key, description key, output key)
+_HABITAT_SPECS = (
+    (
+        "speciesMarineHabitats",
+        "marineHabitat",
+        "marineHabitatDescEn",
+        "marineHabitats",
+    ),
+    (
+        "speciesTerrestrialHabitats",
+        "terrestrialHabitat",
+        "terrestrialHabitatDescEn",
+        "terrestrialHabitats",
+    ),
+    (
+        "speciesRiverineHabitats",
+        "riverineHabitat",
+        "riverineHabitatDescEn",
+        "riverineHabitats",
+    ),
+    (
+        "speciesPalustrineHabitats",
+        "palustrineHabitat",
+        "palustrineHabitatDescEn",
+        "palustrineHabitats",
+    ),
+    (
+        "speciesLacustrineHabitats",
+        "lacustrineHabitat",
+        "lacustrineHabitatDescEn",
+        "lacustrineHabitats",
+    ),
+    (
+        "speciesSubterraneanHabitats",
+        "subterraneanHabitat",
+        "subterraneanHabitatDescEn",
+        "subterraneanHabitats",
+    ),
+    (
+        "speciesEstuarineHabitats",
+        "estuarineHabitat",
+        "estuarineHabitatDescEn",
+        "estuarineHabitats",
+    ),
+)
+
+# Output columns after "url", in the order extract_data's keys are written
+_DATA_KEYS = (
+    "elementGlobalId",
+    "uniqueId",
+    "speciesGlobalElementGlobalId",
+    "primaryCommonName",
+    "scientificName",
+    "lastModified",
+    "grankReasons",
+    "habitatComments",
+    "rangeExtent",
+    "threatCategories",
+    "threatComments",
+    "marineHabitats",
+    "terrestrialHabitats",
+    "riverineHabitats",
+    "palustrineHabitats",
+    "lacustrineHabitats",
+    "subterraneanHabitats",
+    "estuarineHabitats",
+)
+
+# Blank cells that follow the error message in a failed row
+_ERROR_PADDING = ("",) * (len(_DATA_KEYS) - 1)
+
+# urllib3 connection pool shared by the whole run (see load_http_backend)
+_POOL = None
+_TAXON_DECODER = None
+
 
 def format_last_modified(last_modified: Optional[str]) -> Optional[str]:
     """Convert lastModified ISO date to human-friendly date."""
@@ -24,33 +240,44 @@ def format_last_modified(last_modified: Optional[str]) -> Optional[str]:
         return last_modified
 
 
-def extract_habitat_descriptions(
-    habitat_list: Optional[list], habitat_key: str, desc_key: str
-) -> Optional[str]:
+def make_habitat_extractor(api_key: str, habitat_key: str, desc_key: str):
     """
-    Extract habitat descriptions (english language).
+    Build an extractor for one habitat type's descriptions (english language).
+
+    The keys are bound once here, so extract_data only pays for the lookups
+    themselves on each record.
 
     Args:
-        habitat_list: List of habitat objects
+        api_key: The speciesCharacteristics key holding the habitat list (e.g., 'speciesMarineHabitats')
         habitat_key: The key name for the nested habitat object (e.g., 'marineHabitat', 'terrestrialHabitat')
         desc_key: The key name for the description (e.g., 'marineHabitatDescEn', 'terrestrialHabitatDescEn')
 
     Returns:
-        Comma-separated habitat descriptions, or None if no descriptions found
+        Function taking speciesCharacteristics and returning comma-separated
+        habitat descriptions, or None if no descriptions found
     """
-    if not habitat_list or not isinstance(habitat_list, list):
-        return None
 
-    descriptions = []
-    for item in habitat_list:
-        if isinstance(item, dict):
-            habitat_obj = item.get(habitat_key)
-            if isinstance(habitat_obj, dict):
-                desc = habitat_obj.get(desc_key)
-                if desc:
-                    descriptions.append(str(desc))
+    def extract(species_chars: dict) -> Optional[str]:
+        return (
+            ", ".join(
+                [
+                    str(desc)
+                    for item in species_chars.get(api_key) or ()
+                    if isinstance(item, dict)
+                    and isinstance(habitat_obj := item.get(habitat_key), dict)
+                    and (desc := habitat_obj.get(desc_key))
+                ]
+            )
+            or None
+        )
+
+    return extract
 
-    return ", ".join(descriptions) if descriptions else None
+
+_HABITAT_EXTRACTORS = tuple(
+    (output_key, make_habitat_extractor(api_key, habitat_key, desc_key))
+    for api_key, habitat_key, desc_key, output_key in _HABITAT_SPECS
+)
 
 
 def extract_threat_categories(threat_assessments: Optional[list]) -> Optional[str]:
@@ -107,51 +334,6 @@ def extract_data(full_data: dict) -> dict:
 
     last_modified_readable = format_last_modified(full_data.get("lastModified"))
 
-    habitat_types = [
-        (
-            "speciesMarineHabitats",
-            "marineHabitat",
-            "marineHabitatDescEn",
-            "marineHabitats",
-        ),
-        (
-            "speciesTerrestrialHabitats",
-            "terrestrialHabitat",
-            "terrestrialHabitatDescEn",
-            "terrestrialHabitats",
-        ),
-        (
-            "speciesRiverineHabitats",
-            "riverineHabitat",
-            "riverineHabitatDescEn",
-            "riverineHabitats",
-        ),
-        (
-            "speciesPalustrineHabitats",
-            "palustrineHabitat",
-            "palustrineHabitatDescEn",
-            "palustrineHabitats",
-        ),
-        (
-            "speciesLacustrineHabitats",
-            "lacustrineHabitat",
-            "lacustrineHabitatDescEn",
-            "lacustrineHabitats",
-        ),
-        (
-            "speciesSubterraneanHabitats",
-            "subterraneanHabitat",
-            "subterraneanHabitatDescEn",
-            "subterraneanHabitats",
-        ),
-        (
-            "speciesEstuarineHabitats",
-            "estuarineHabitat",
-            "estuarineHabitatDescEn",
-            "estuarineHabitats",
-        ),
-    ]
-
     threat_categories = extract_threat_categories(
         full_data.get("elementGlobalThreatAssessments")
     )
@@ -170,16 +352,123 @@ def extract_data(full_data: dict) -> dict:
         "threatComments": rank_info.get("threatImpactComments"),
     }
 
-    for api_key, habitat_key, desc_key, output_key in habitat_types:
-        habitat_data = species_chars.get(api_key)
-        descriptions = extract_habitat_descriptions(habitat_data, habitat_key, desc_key)
-        extracted[output_key] = descriptions
+    for output_key, extract_habitats in _HABITAT_EXTRACTORS:
+        extracted[output_key] = extract_habitats(species_chars)
 
     return extracted
 
 
+def build_taxon_decoder() -> "msgspec.json.Decoder":
+    """
+    Build a msgspec decoder for just the fields extract_data reads.
+
+    Every other key in the (large) API response is skipped while parsing
+    instead of being materialized as Python objects.
+    """
+
+    def struct(name: str, fields: list):
+        return msgspec.defstruct(name, [(key, kind, None) for key, kind in fields])
+
+    def habitat_list(habitat_key: str, desc_key: str):
+        habitat = struct(habitat_key, [(desc_key, Any)])
+        item = struct(f"{habitat_key}Item", [(habitat_key, Optional[habitat])])
+        return Optional[list[item]]
+
+    species_chars = struct(
+        "SpeciesCharacteristics",
+        [("habitatComments", Any)]
+        + [
+            (api_key, habitat_list(habitat_key, desc_key))
+            for api_key, habitat_key, desc_key, _ in _HABITAT_SPECS
+        ],
+    )
+    rank_info = struct(
+        "RankInfo",
+        [
+            (
+                "rangeExtent",
+                Optional[struct("RangeExtent", [("rangeExtentDescEn", Any)])],
+            ),
+            ("threatImpactComments", Any),
+        ],
+    )
+    threat_assessment = struct(
+        "ThreatAssessment",
+        [
+            (
+                "iucnThreatCategory",
+                Optional[struct("IucnThreatCategory", [("displayValueEn", Any)])],
+            )
+        ],
+    )
+    taxon = struct(
+        "Taxon",
+        [
+            ("elementGlobalId", Any),
+            ("uniqueId", Any),
+            ("primaryCommonName", Any),
+            ("scientificName", Any),
+            ("lastModified", Any),
+            ("grankReasons", Any),
+            (
+                "speciesGlobal",
+                Optional[struct("SpeciesGlobal", [("elementGlobalId", Any)])],
+            ),
+            ("rankInfo", Optional[rank_info]),
+            ("speciesCharacteristics", Optional[species_chars]),
+            ("elementGlobalThreatAssessments", Optional[list[threat_assessment]]),
+        ],
+    )
+    return msgspec.json.Decoder(taxon)
+
+
+def load_json_backend():
+    """
+    Import the optional fast JSON parsers, if installed.
+
+    orjson replaces json.loads, and msgspec enables the field-selecting
+    decoder. Also used as the parse pool initializer so worker processes
+    parse the same way.
+    """
+    global msgspec, _loads, _TAXON_DECODER
+
+    try:
+        import orjson
+
+        _loads = orjson.loads
+    except ImportError:
+        pass
+
+    try:
+        import msgspec
+    except ImportError:
+        return
+
+    _TAXON_DECODER = build_taxon_decoder()
+
+
+def decode_taxon(body: bytes) -> dict:
+    """
+    Parse an API response body into the dict extract_data expects.
+
+    Uses the msgspec field-selecting decoder when available, falling back to a
+    full parse if the response doesn't match the expected shape.
+    """
+    if _TAXON_DECODER is not None:
+        try:
+            return msgspec.to_builtins(_TAXON_DECODER.decode(body))
+        except msgspec.ValidationError:
+            pass
+    return _loads(body)
+
+
 def format_csv_value(value: Any) -> str:
-    """Format for CSV output."""
+    """
+    Format an arbitrary value for CSV output.
+
+    Extracted taxon fields are always None or scalars and skip this; see
+    format_csv_row.
+    """
     if value is None:
         return ""
     if isinstance(value, (dict, list)):
@@ -187,40 +476,343 @@ def format_csv_value(value: Any) -> str:
     return str(value)
 
 
-def fetch_taxon_data(route: str, i: int) -> dict:
-    """Fetch data for a single taxon route."""
-    url = f"{API_HOST}{API_PATH}{route}"
-    print(f"Fetching: {url}")
+def load_http_backend(backend: Optional[str] = None) -> str:
+    """
+    Import the HTTP client for a backend, falling back when it isn't installed.
+
+    Args:
+        backend: One of BACKENDS, or None for urllib3 when available
+
+    Returns:
+        The backend that will actually be used
+    """
+    global urllib3, aiohttp, _POOL
+
+    requested = backend
+    if backend == "aiohttp":
+        try:
+            import aiohttp
+        except ImportError:
+            backend = "urllib3"
+
+    if backend in (None, "urllib3"):
+        try:
+            import urllib3
+        except ImportError:
+            backend = "stdlib"
+        else:
+            backend = "urllib3"
+
+    if requested and backend != requested:
+        logger.warning("%s is not installed, using %s instead", requested, backend)
+
+    if backend == "urllib3" and _POOL is None:
+        # One pool for the whole run so connections to the API host are kept
+        # alive and reused instead of paying a new TCP + TLS handshake per
+        # request.
+        _POOL = urllib3.PoolManager(
+            num_pools=1,
+            maxsize=16,
+            retries=urllib3.Retry(
+                total=3,
+                backoff_factor=0.5,
+                # 429s are left to RATE_LIMITER so every worker slows down
+                status_forcelist=(500, 502, 503, 504),
+                raise_on_status=False,
+            ),
+        )
+    elif backend != "urllib3":
+        _POOL = None
+
+    return backend
+
+
+def http_get(url: str) -> tuple:
+    """
+    GET a URL through the shared connection pool.
+
+    Falls back to urllib.request (one connection per request) unless the
+    urllib3 backend is loaded.
+
+    Returns:
+        Tuple of (status, reason, headers, body bytes)
+    """
+    if _POOL is not None:
+        response = _POOL.request("GET", url, timeout=10.0)
+        return response.status, response.reason, response.headers, response.data
 
     try:
         with urllib.request.urlopen(url, timeout=10) as response:
-            if response.status != 200:
-                error_msg = f"{response.status} {response.reason}"
-                print(f"Failed to fetch {url}: {error_msg}")
-                return {"url": url, "error": error_msg, "data": None}
+            return response.status, response.reason, response.headers, response.read()
+    except urllib.error.HTTPError as error:
+        return error.code, error.reason, error.headers, b""
 
-            full_data = json.loads(response.read().decode("utf-8"))
-            extracted_data = extract_data(full_data)
 
-            print(f"✓ Successfully fetched ({i + 1}/{len(CURRENT_SET)}) {url}")
-            return {"url": url, "data": extracted_data}
+def cache_path_for(url: str) -> Path:
+    """Cache file for a taxon URL, named after its route (the species ID)."""
+    return CACHE_DIR / f"{url.rsplit('/', 1)[-1]}.json.gz"
 
-    except urllib.error.HTTPError as error:
-        error_msg = f"{error.code} {error.reason}"
-        print(f"Failed to fetch {url}: {error_msg}")
+
+def read_cached_response(url: str) -> Optional[bytes]:
+    """Return the cached response body for a URL, or None on a cache miss."""
+    if CACHE_DIR is None:
+        return None
+
+    cache_path = cache_path_for(url)
+    try:
+        if cache_path.stat().st_size == 0:
+            return None
+        with gzip.open(cache_path, "rb") as cache_file:
+            return cache_file.read()
+    except (OSError, EOFError, zlib.error):
+        return None
+
+
+def discard_cached_response(url: str):
+    """Delete the cache entry for a URL, e.g. after it failed to parse."""
+    try:
+        cache_path_for(url).unlink(missing_ok=True)
+    except OSError as error:
+        logger.warning("Could not remove cache entry for %s: %s", url, error)
+
+
+def write_cached_response(url: str, body: bytes):
+    """
+    Cache a successfully parsed response body for a URL.
+
+    A failed write is logged and skipped; it never fails the fetch itself.
+    """
+    if CACHE_DIR is None:
+        return
+
+    cache_path = cache_path_for(url)
+    # Write to a temp file first so a concurrent reader never sees half a file
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{threading.get_ident()}.tmp")
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with gzip.open(tmp_path, "wb", compresslevel=1) as cache_file:
+            cache_file.write(body)
+        os.replace(tmp_path, cache_path)
+    except OSError as error:
+        logger.warning("Could not cache %s: %s", url, error)
+        tmp_path.unlink(missing_ok=True)
+
+
+def parse_and_extract(body: bytes) -> dict:
+    """Parse a response body and extract its fields (runs in the parse pool)."""
+    return extract_data(decode_taxon(body))
+
+
+def taxon_success(url: str, i: int, total: int, extracted_data: dict) -> dict:
+    """Build the fetch result for a successfully parsed taxon."""
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("✓ Successfully fetched (%d/%d) %s", i + 1, total, url)
+    return {"url": url, "data": extracted_data}
+
+
+def parse_taxon_response(
+    url: str,
+    i: int,
+    total: int,
+    status: int,
+    reason: str,
+    body: bytes,
+    parse_pool: Optional[ProcessPoolExecutor] = None,
+) -> dict:
+    """Turn a raw API response into a fetch result."""
+    if status != 200:
+        error_msg = f"{status} {reason}"
+        logger.warning("Failed to fetch %s: %s", url, error_msg)
         return {"url": url, "error": error_msg, "data": None}
+
+    extracted_data = None
+    if parse_pool is not None and len(body) >= PARSE_IN_PROCESS_BYTES:
+        try:
+            extracted_data = parse_pool.submit(parse_and_extract, body).result()
+        except BrokenProcessPool:
+            pass
+    if extracted_data is None:
+        extracted_data = parse_and_extract(body)
+
+    return taxon_success(url, i, total, extracted_data)
+
+
+async def parse_taxon_response_async(
+    url: str,
+    i: int,
+    total: int,
+    status: int,
+    reason: str,
+    body: bytes,
+    parse_pool: Optional[ProcessPoolExecutor] = None,
+) -> dict:
+    """Like parse_taxon_response, but waits on the parse pool without blocking the loop."""
+    if status == 200 and parse_pool is not None and len(body) >= PARSE_IN_PROCESS_BYTES:
+        try:
+            future = parse_pool.submit(parse_and_extract, body)
+            return taxon_success(url, i, total, await asyncio.wrap_future(future))
+        except BrokenProcessPool:
+            pass
+
+    return parse_taxon_response(url, i, total, status, reason, body)
+
+
+def fetch_taxon_data(
+    url: str, i: int, total: int, parse_pool: Optional[ProcessPoolExecutor] = None
+) -> dict:
+    """Fetch data for a single taxon URL."""
+    try:
+        body = read_cached_response(url)
+        if body is not None:
+            try:
+                return parse_taxon_response(url, i, total, 200, "OK", body, parse_pool)
+            except Exception as error:
+                # Drop the bad entry and fetch the species from the API instead
+                logger.warning("Discarding bad cache entry for %s: %s", url, error)
+                discard_cached_response(url)
+
+        for _ in range(RATE_LIMIT_RETRIES + 1):
+            RATE_LIMITER.acquire()
+            status, reason, headers, body = http_get(url)
+            RATE_LIMITER.on_response(status, headers)
+            if status != 429:
+                break
+        result = parse_taxon_response(url, i, total, status, reason, body, parse_pool)
+        # Only cache bodies that parsed, so a bad 200 isn't replayed forever
+        if status == 200:
+            write_cached_response(url, body)
+        return result
     except Exception as error:
         error_msg = str(error)
-        print(f"Error fetching {url}: {error_msg}")
+        logger.warning("Error fetching %s: %s", url, error_msg)
         return {"url": url, "error": error_msg, "data": None}
 
 
-def fetch_data(datafile_name: str):
+async def fetch_taxon_data_async(
+    session: "aiohttp.ClientSession",
+    url: str,
+    i: int,
+    total: int,
+    semaphore: asyncio.Semaphore,
+    parse_pool: Optional[ProcessPoolExecutor] = None,
+) -> dict:
+    """Fetch data for a single taxon URL on the event loop."""
+    try:
+        body = None
+        if CACHE_DIR is not None:
+            # Cache I/O is blocking gzip file work, so keep it off the event loop
+            body = await asyncio.to_thread(read_cached_response, url)
+        if body is not None:
+            try:
+                return await parse_taxon_response_async(
+                    url, i, total, 200, "OK", body, parse_pool
+                )
+            except Exception as error:
+                # Drop the bad entry and fetch the species from the API instead
+                logger.warning("Discarding bad cache entry for %s: %s", url, error)
+                await asyncio.to_thread(discard_cached_response, url)
+
+        async with semaphore:
+            for _ in range(RATE_LIMIT_RETRIES + 1):
+                await RATE_LIMITER.acquire_async()
+                async with session.get(url) as response:
+                    body = await response.read()
+                RATE_LIMITER.on_response(response.status, response.headers)
+                if response.status != 429:
+                    break
+        result = await parse_taxon_response_async(
+            url, i, total, response.status, response.reason, body, parse_pool
+        )
+        # Only cache bodies that parsed, so a bad 200 isn't replayed forever
+        if response.status == 200 and CACHE_DIR is not None:
+            await asyncio.to_thread(write_cached_response, url, body)
+        return result
+    except Exception as error:
+        error_msg = str(error) or type(error).__name__
+        logger.warning("Error fetching %s: %s", url, error_msg)
+        return {"url": url, "error": error_msg, "data": None}
+
+
+def fetch_all_threaded(
+    urls: list, on_result, parse_pool: Optional[ProcessPoolExecutor] = None
+):
+    """Fetch URLs on a thread pool, calling on_result(i, result) as each finishes."""
+    total = len(urls)
+    executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+    try:
+        futures = {
+            executor.submit(fetch_taxon_data, url, i, total, parse_pool): i
+            for i, url in enumerate(urls)
+        }
+        for future in as_completed(futures):
+            on_result(futures[future], future.result())
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+async def fetch_all_async(
+    urls: list, on_result, parse_pool: Optional[ProcessPoolExecutor] = None
+):
+    """Fetch URLs on one event loop, calling on_result(i, result) as each finishes."""
+    total = len(urls)
+    semaphore = asyncio.Semaphore(ASYNC_CONCURRENCY)
+    connector = aiohttp.TCPConnector(limit=ASYNC_CONCURRENCY, keepalive_timeout=60)
+    timeout = aiohttp.ClientTimeout(total=10)
+
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+
+        async def fetch_indexed(i: int, url: str) -> tuple:
+            return i, await fetch_taxon_data_async(
+                session, url, i, total, semaphore, parse_pool
+            )
+
+        tasks = [
+            asyncio.ensure_future(fetch_indexed(i, url)) for i, url in enumerate(urls)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                on_result(*await next_done)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+
+def format_csv_row(result: dict) -> list:
+    """Build the CSV row for a fetch result."""
+    if result.get("error"):
+        return [result["url"], format_csv_value(result["error"]), *_ERROR_PADDING]
+
+    # extract_data only produces None or scalars for these keys, and the csv
+    # writer already str()s scalars, so only None needs replacing
+    data = result["data"]
+    return [
+        result["url"],
+        *("" if (v := data.get(k)) is None else v for k in _DATA_KEYS),
+    ]
+
+
+def fetch_data(
+    datafile_name: str,
+    routes: list,
+    previous_rows: Optional[list] = None,
+    backend: Optional[str] = None,
+):
     """Fetch all taxon data and save to CSV.
 
+    The aiohttp backend runs every request on a single event loop; the
+    urllib3 and stdlib backends use a thread pool.
+
     Args:
         datafile_name: Name of the datafile (also used to generate output filename)
+        routes: Species IDs to fetch, in output order
+        previous_rows: Rows already fetched by an earlier run (from --resume), lined
+            up with routes, with None for each route that still needs fetching
+        backend: HTTP client, one of BACKENDS (default: urllib3 when installed)
     """
+    backend = load_http_backend(backend)
+    load_json_backend()
+    logger.info("Using the %s HTTP backend", backend)
+
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     datafile_stem = Path(datafile_name).stem
     output_filename = f"{datafile_stem}_{timestamp}.csv"
@@ -228,74 +820,70 @@ def fetch_data(datafile_name: str):
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    headers = [
-        "url",
-        "elementGlobalId",
-        "uniqueId",
-        "speciesGlobalElementGlobalId",
-        "primaryCommonName",
-        "scientificName",
-        "lastModified",
-        "grankReasons",
-        "habitatComments",
-        "rangeExtent",
-        "threatCategories",
-        "threatComments",
-        "marineHabitats",
-        "terrestrialHabitats",
-        "riverineHabitats",
-        "palustrineHabitats",
-        "lacustrineHabitats",
-        "subterraneanHabitats",
-        "estuarineHabitats",
-    ]
+    headers = ["url", *_DATA_KEYS]
 
+    urls = [f"{API_HOST}{API_PATH}{route}" for route in routes]
     rows_written = 0
-    total_routes = len(CURRENT_SET)
+    total_routes = len(urls)
 
     try:
-        with open(output_path, "w", newline="", encoding="utf-8") as csvfile:
+        with open(
+            output_path, "w", newline="", encoding="utf-8", buffering=1 << 20
+        ) as csvfile:
             writer = csv.writer(csvfile)
             writer.writerow(headers)
 
-            for i, route in enumerate(CURRENT_SET):
-                result = fetch_taxon_data(route, i)
+            # Rows carried over from an earlier run are slotted in up front so
+            # the file still comes out in datafile order
+            rows = list(previous_rows) if previous_rows else [None] * total_routes
+            fetch_indexes = [i for i, row in enumerate(rows) if row is None]
+            next_index = 0
+            pending = []
+
+            def queue_ready_rows():
+                nonlocal next_index, rows_written
+                # Queue rows in input order as soon as the next one is ready
+                while next_index < total_routes and rows[next_index]:
+                    pending.append(rows[next_index])
+                    rows[next_index] = None
+                    next_index += 1
+
+                if len(pending) >= FLUSH_EVERY:
+                    writer.writerows(pending)
+                    rows_written += len(pending)
+                    pending.clear()
+                    csvfile.flush()
+
+            def handle_result(j: int, result: dict):
+                rows[fetch_indexes[j]] = format_csv_row(result)
+                queue_ready_rows()
+
+            queue_ready_rows()
+            fetch_urls = [urls[i] for i in fetch_indexes]
 
-                if result.get("error"):
-                    row = [result["url"], result["error"]] + [""] * (len(headers) - 2)
-                    writer.writerow(row)
+            # Worker processes are only started once a large response arrives,
+            # from inside a fetch thread, so spawn them rather than forking
+            # a process that has other threads mid-request
+            parse_pool = ProcessPoolExecutor(
+                max_workers=PARSE_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=load_json_backend,
+            )
+            try:
+                if backend == "aiohttp":
+                    asyncio.run(fetch_all_async(fetch_urls, handle_result, parse_pool))
                 else:
-                    data = result["data"]
-                    row = [
-                        result["url"],
-                        format_csv_value(data.get("elementGlobalId")),
-                        format_csv_value(data.get("uniqueId")),
-                        format_csv_value(data.get("speciesGlobalElementGlobalId")),
-                        format_csv_value(data.get("primaryCommonName")),
-                        format_csv_value(data.get("scientificName")),
-                        format_csv_value(data.get("lastModified")),
-                        format_csv_value(data.get("grankReasons")),
-                        format_csv_value(data.get("habitatComments")),
-                        format_csv_value(data.get("rangeExtent")),
-                        format_csv_value(data.get("threatCategories")),
-                        format_csv_value(data.get("threatComments")),
-                        format_csv_value(data.get("marineHabitats")),
-                        format_csv_value(data.get("terrestrialHabitats")),
-                        format_csv_value(data.get("riverineHabitats")),
-                        format_csv_value(data.get("palustrineHabitats")),
-                        format_csv_value(data.get("lacustrineHabitats")),
-                        format_csv_value(data.get("subterraneanHabitats")),
-                        format_csv_value(data.get("estuarineHabitats")),
-                    ]
-                    writer.writerow(row)
-
-                rows_written += 1
+                    fetch_all_threaded(fetch_urls, handle_result, parse_pool)
+            finally:
+                parse_pool.shutdown(cancel_futures=True)
+                # Keep partial progress on disk if a fetch blows up mid-run,
+                # including rows that finished behind one that never did
+                pending.extend(row for row in rows[next_index:] if row is not None)
+                writer.writerows(pending)
+                rows_written += len(pending)
+                pending.clear()
                 csvfile.flush()
 
-                if i < total_routes - 1:
-                    print("Rate limiting...")
-                    time.sleep(0.5)
-
         print(
             f"\n✓ Complete: Successfully wrote all {rows_written}/{total_routes} rows to {output_path}"
         )
@@ -327,14 +915,71 @@ def load_species_from_csv(file_path: str) -> list:
     if not path.exists():
         raise FileNotFoundError(f"Data file not found: {file_path}")
 
-    species_ids = []
-    with open(path, "r", encoding="utf-8") as csvfile:
+    # A single unquoted column, so plain line splitting is all the parsing needed
+    with open(path, "rb") as csvfile:
+        data = csvfile.read().decode("utf-8")
+
+    return [species_id for line in data.splitlines() if (species_id := line.strip())]
+
+
+def find_latest_results(datafile_name: str) -> Optional[Path]:
+    """
+    Find the newest results file written for a datafile.
+
+    Args:
+        datafile_name: Name of the datafile the results were generated from
+
+    Returns:
+        Path to the newest results/<stem>_<timestamp>.csv, or None if there is none
+    """
+    datafile_stem = Path(datafile_name).stem
+    pattern = re.compile(rf"{re.escape(datafile_stem)}_\d{{8}}_\d{{6}}\.csv")
+    matches = sorted(
+        path
+        for path in Path("results").glob(f"{datafile_stem}_*.csv")
+        if pattern.fullmatch(path.name)
+    )
+    return matches[-1] if matches else None
+
+
+def load_completed_rows(results_path: Path) -> dict:
+    """
+    Collect the rows that were fetched successfully in a previous results file.
+
+    Failed rows (which have no uniqueId) are left out, so they get retried.
+
+    Args:
+        results_path: Path to a results CSV written by fetch_data
+
+    Returns:
+        Dict of URL to its CSV row, for URLs that don't need fetching again
+    """
+    with open(results_path, "r", newline="", encoding="utf-8") as csvfile:
         reader = csv.reader(csvfile)
+        header = next(reader, None)
+        if not header:
+            return {}
+        url_col, unique_id_col = header.index("url"), header.index("uniqueId")
+        completed = {}
         for row in reader:
-            if row and row[0].strip():
-                species_ids.append(row[0].strip())
+            if len(row) > unique_id_col and row[unique_id_col]:
+                completed.setdefault(row[url_col], row)
+        return completed
+
 
-    return species_ids
+def match_completed_rows(routes: list, completed: dict) -> list:
+    """
+    Line up rows from a previous results file with the routes to fetch.
+
+    Args:
+        routes: Species IDs to fetch, in output order
+        completed: Dict of URL to CSV row, from load_completed_rows
+
+    Returns:
+        List with the previous row for each route already fetched, or None
+        for routes that still need fetching
+    """
+    return [completed.pop(f"{API_HOST}{API_PATH}{route}", None) for route in routes]
 
 
 if __name__ == "__main__":
@@ -347,12 +992,48 @@ if __name__ == "__main__":
         required=True,
         help="Path to CSV file containing species IDs (e.g., animals_set_1.csv)",
     )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Reuse species already fetched in the newest results file for this datafile and only fetch the rest",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=BACKENDS,
+        default=None,
+        help="HTTP client to use (default: urllib3 if installed, otherwise stdlib)",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Cache raw API responses in cache/ and reuse them on later runs",
+    )
     args = parser.parse_args()
 
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+
+    if args.cache:
+        CACHE_DIR = Path("cache")
+
     try:
-        CURRENT_SET = load_species_from_csv(args.datafile)
-        print(f"Loaded {len(CURRENT_SET)} routes from {args.datafile}\n")
-        fetch_data(args.datafile)
+        routes = load_species_from_csv(args.datafile)
+        print(f"Loaded {len(routes)} routes from {args.datafile}\n")
+
+        previous_rows = None
+        resume_path = find_latest_results(args.datafile) if args.resume else None
+        if resume_path:
+            previous_rows = match_completed_rows(
+                routes, load_completed_rows(resume_path)
+            )
+            reused = sum(row is not None for row in previous_rows)
+            print(
+                f"Resuming {resume_path}: reusing {reused} rows, "
+                f"{len(routes) - reused} routes left to fetch\n"
+            )
+        elif args.resume:
+            print("No previous results found to resume, starting a new file\n")
+
+        fetch_data(args.datafile, routes, previous_rows, args.backend)
     except FileNotFoundError as e:
         print(f"Error: {e}")
         exit(1)